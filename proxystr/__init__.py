@@ -3,3 +3,5 @@ from .extended_proxy import check_proxy, check_proxies, acheck_proxy, acheck_pro
 from .extended_proxy import read_proxies
 from .proxy import ProxyPattern, PlaywrightProxySettings
 from .client import Client, AsyncClient
+from .resolver import DNSCache, dns_cache
+from .scheduler import CheckScheduler, GroupLimits
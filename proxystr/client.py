@@ -1,31 +1,53 @@
-from typing import Union
+from typing import Optional, Union
 
 import httpx
 from httpx_socks import AsyncProxyTransport, SyncProxyTransport
 from .proxy import Proxy
+from .resolver import DNSCache, dns_cache as default_dns_cache
 
 
 class Client(httpx.Client):
-    def __init__(self, *args, proxy: Union[Proxy, str] = None, follow_redirects=True, **kwargs):
+    def __init__(
+        self,
+        *args,
+        proxy: Union[Proxy, str] = None,
+        follow_redirects=True,
+        dns_cache: Optional[DNSCache] = default_dns_cache,
+        **kwargs
+    ):
         if proxy:
             proxy = Proxy(proxy)
+            url = proxy.url
+            if dns_cache:
+                dns_cache.resolve(proxy.ip)
+                url = dns_cache.resolved_url(proxy)
             if 'http' in proxy.protocol:
-                kwargs['proxy'] = proxy.url
+                kwargs['proxy'] = url
             elif 'socks' in proxy.protocol:
-                kwargs['transport'] = SyncProxyTransport.from_url(proxy.url)
+                kwargs['transport'] = SyncProxyTransport.from_url(url)
             else:
                 raise ValueError(f'Unsupported proxy protocol "{proxy.protocol}".')
         super().__init__(*args, follow_redirects=follow_redirects, **kwargs)
 
 
 class AsyncClient(httpx.AsyncClient):
-    def __init__(self, *args, proxy: Union[Proxy, str] = None, follow_redirects=True, **kwargs):
+    def __init__(
+        self,
+        *args,
+        proxy: Union[Proxy, str] = None,
+        follow_redirects=True,
+        dns_cache: Optional[DNSCache] = default_dns_cache,
+        **kwargs
+    ):
         if proxy:
             proxy = Proxy(proxy)
+            # only an already cached address is used here, resolving would block the event loop.
+            # await dns_cache.aresolve(...) or aresolve_many(...) beforehand to warm it up
+            url = dns_cache.resolved_url(proxy) if dns_cache else proxy.url
             if 'http' in proxy.protocol:
-                kwargs['proxy'] = proxy.url
+                kwargs['proxy'] = url
             elif 'socks' in proxy.protocol:
-                kwargs['transport'] = AsyncProxyTransport.from_url(proxy.url)
+                kwargs['transport'] = AsyncProxyTransport.from_url(url)
             else:
                 raise ValueError(f'Unsupported proxy protocol "{proxy.protocol}".')
         super().__init__(*args, follow_redirects=follow_redirects, **kwargs)
@@ -1,4 +1,4 @@
-from typing import Union, Dict, List, Tuple
+from typing import TYPE_CHECKING, Union, Dict, List, Tuple, Optional
 import asyncio
 
 from pydantic.networks import HttpUrl
@@ -7,6 +7,10 @@ from python_socks._errors import ProxyConnectionError
 
 from .proxy import Proxy as BaseProxy
 from .client import Client, AsyncClient
+from .resolver import DNSCache, dns_cache as default_dns_cache
+
+if TYPE_CHECKING:
+    from .scheduler import CheckScheduler
 
 
 URL_FOR_CHECK = 'https://whoer.net'
@@ -41,7 +45,8 @@ async def acheck_proxy(
     url: str = None,
     with_info: bool = False,
     fields: str = DEFAULT_CHECK_FIELDS,
-    raise_on_error: bool = False
+    raise_on_error: bool = False,
+    dns_cache: Optional[DNSCache] = default_dns_cache
 ) -> Tuple[Proxy, Union[bool, Dict]]:
     if not isinstance(proxy, Proxy):
         proxy = Proxy(proxy)
@@ -49,8 +54,11 @@ async def acheck_proxy(
     if not url:
         url = URL_FOR_CHECK_WHITH_INFO.format(fields=fields) if with_info else URL_FOR_CHECK
 
+    if dns_cache:
+        await dns_cache.aresolve(proxy.ip)
+
     try:
-        async with AsyncClient(proxy=proxy, timeout=10) as client:
+        async with AsyncClient(proxy=proxy, timeout=10, dns_cache=dns_cache) as client:
             response = await client.get(url)
             if response.status_code == 200:
                 if with_info:
@@ -70,23 +78,33 @@ async def acheck_proxies(
     url: str = None,
     with_info: bool = False,
     fields: str = DEFAULT_CHECK_FIELDS,
-    raise_on_error: bool = False
+    raise_on_error: bool = False,
+    dns_cache: Optional[DNSCache] = default_dns_cache,
+    scheduler: Optional['CheckScheduler'] = None
 ) -> Union[
     Tuple[List[Proxy], List[Proxy]],
     Tuple[List[Tuple[Proxy, Dict]], List[Tuple[Proxy, bool]]]
 ]:
-
-    tasks = [acheck_proxy(proxy, url, with_info, fields, raise_on_error) for proxy in proxy_list]
-    results = await asyncio.gather(*tasks)
-
-    if with_info:
-        success = [(proxy, info) for proxy, info in results if info]
-        failed = [(proxy, info) for proxy, info in results if not info]
+    if scheduler:
+        # the scheduler is configured with its own cache
+        dns_cache = scheduler.dns_cache
+
+    proxy_list = [p if isinstance(p, Proxy) else Proxy(p) for p in proxy_list]
+    if dns_cache:
+        await dns_cache.aresolve_many(p.ip for p in proxy_list)
+
+    # proxies resolving to the same endpoint are checked once
+    keys = [_endpoint(proxy, dns_cache) for proxy in proxy_list]
+    endpoints = {}
+    for key, proxy in zip(keys, proxy_list):
+        endpoints.setdefault(key, proxy)
+
+    if scheduler:
+        infos = await scheduler.acheck_endpoints(endpoints, url, with_info, fields, raise_on_error)
     else:
-        success = [proxy for proxy, status in results if status]
-        failed = [proxy for proxy, status in results if not status]
-
-    return success, failed
+        tasks = [acheck_proxy(proxy, url, with_info, fields, raise_on_error, dns_cache) for proxy in endpoints.values()]
+        infos = dict(zip(endpoints, (info for _, info in await asyncio.gather(*tasks))))
+    return _split_results(proxy_list, keys, infos, with_info)
 
 
 def check_proxy(
@@ -94,7 +112,8 @@ def check_proxy(
     url: str = None,
     with_info: bool = False,
     fields: str = DEFAULT_CHECK_FIELDS,
-    raise_on_error: bool = False
+    raise_on_error: bool = False,
+    dns_cache: Optional[DNSCache] = default_dns_cache
 ) -> Tuple[Proxy, Union[bool, Dict]]:
     if not isinstance(proxy, Proxy):
         proxy = Proxy(proxy)
@@ -103,7 +122,7 @@ def check_proxy(
         url = URL_FOR_CHECK_WHITH_INFO.format(fields=fields) if with_info else URL_FOR_CHECK
 
     try:
-        with Client(timeout=10, proxy=proxy) as client:
+        with Client(timeout=10, proxy=proxy, dns_cache=dns_cache) as client:
             response = client.get(url)
             if response.status_code == 200:
                 if with_info:
@@ -124,23 +143,55 @@ def check_proxies(
     with_info: bool = False,
     fields: str = DEFAULT_CHECK_FIELDS,
     raise_on_error: bool = False,
-    use_async: bool = True
+    use_async: bool = True,
+    dns_cache: Optional[DNSCache] = default_dns_cache,
+    scheduler: Optional['CheckScheduler'] = None
 ) -> Union[
     Tuple[List[Proxy], List[Proxy]],
     Tuple[List[Tuple[Proxy, Dict]], List[Tuple[Proxy, bool]]]
 ]:
+    if scheduler and not use_async:
+        raise ValueError('scheduler works only with use_async=True')
     if use_async:
-        return asyncio.run(acheck_proxies(proxy_list, url, with_info, fields, raise_on_error))
+        return asyncio.run(acheck_proxies(proxy_list, url, with_info, fields, raise_on_error, dns_cache, scheduler))
+    else:
+        proxy_list = [p if isinstance(p, Proxy) else Proxy(p) for p in proxy_list]
+        if dns_cache:
+            dns_cache.resolve_many(p.ip for p in proxy_list)
+
+        keys = [_endpoint(proxy, dns_cache) for proxy in proxy_list]
+        infos = {}
+        for key, proxy in zip(keys, proxy_list):
+            if key not in infos:
+                infos[key] = check_proxy(proxy, url, with_info, fields, raise_on_error, dns_cache)[1]
+        return _split_results(proxy_list, keys, infos, with_info)
+
+
+def _endpoint(proxy: Proxy, dns_cache: Optional[DNSCache]) -> Union[Tuple, str]:
+    """proxies with the same endpoint are checked once"""
+    return dns_cache.endpoint(proxy) if dns_cache else proxy.url
+
+
+def _split_results(
+    proxy_list: List[Proxy],
+    keys: List[Union[Tuple, str]],
+    infos: Dict[Union[Tuple, str], Union[bool, Dict]],
+    with_info: bool
+) -> Union[
+    Tuple[List[Proxy], List[Proxy]],
+    Tuple[List[Tuple[Proxy, Dict]], List[Tuple[Proxy, bool]]]
+]:
+    """results in the order of proxy_list, infos are the results by endpoint keys"""
+    results = [(proxy, infos[key]) for proxy, key in zip(proxy_list, keys)]
+
+    if with_info:
+        success = [(proxy, info) for proxy, info in results if info]
+        failed = [(proxy, info) for proxy, info in results if not info]
     else:
-        success = []
-        failed = []
-        for proxy in proxy_list:
-            proxy, info = check_proxy(proxy, url, with_info, fields, raise_on_error)
-            if with_info:
-                success.append((proxy, info)) if info else failed.append((proxy, info))
-            else:
-                success.append(proxy) if info else failed.append(proxy)
-        return success, failed
+        success = [proxy for proxy, status in results if status]
+        failed = [proxy for proxy, status in results if not status]
+
+    return success, failed
 
 
 def read_proxies(filepath: str) -> List[Proxy]:
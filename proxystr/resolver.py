@@ -0,0 +1,129 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import socket
+import time
+
+from .utils import ProxyStringParser, get_fromated_proxy_string
+
+if TYPE_CHECKING:
+    from .proxy import Proxy
+
+
+DEFAULT_DNS_TTL = 300
+DEFAULT_DNS_NEGATIVE_TTL = 30
+
+
+class DNSCache:
+    """
+    Shared cache of proxy hostname -> IPv4 addresses lookups.
+    The system resolver doesn't expose record TTLs, so entries live for `ttl` seconds
+    (failed lookups for `negative_ttl` seconds). IP addresses are returned as is.
+    All addresses of a multi-A-record hostname are kept and handed out round-robin.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL, negative_ttl: float = DEFAULT_DNS_NEGATIVE_TTL):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._cache: Dict[str, Tuple[Tuple[str, ...], float]] = {}
+        self._counters: Dict[str, int] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def is_ip(host: str) -> bool:
+        return host.replace('.', '').isdigit()
+
+    def get_all(self, host: str) -> Tuple[str, ...]:
+        """returns all cached addresses without resolving, empty if unknown, expired or failed"""
+        if self.is_ip(host):
+            return host,
+        entry = self._cache.get(host)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        return ()
+
+    def get(self, host: str) -> Optional[str]:
+        """returns the next cached address without resolving, None if unknown, expired or failed"""
+        addresses = self.get_all(host)
+        if len(addresses) < 2:
+            return addresses[0] if addresses else None
+        counter = self._counters.get(host, 0)
+        self._counters[host] = counter + 1
+        return addresses[counter % len(addresses)]
+
+    def _is_cached(self, host: str) -> bool:
+        entry = self._cache.get(host)
+        return bool(entry) and entry[1] > time.monotonic()
+
+    def _first(self, host: str) -> Optional[str]:
+        addresses = self.get_all(host)
+        return addresses[0] if addresses else None
+
+    def _store(self, host: str, info: List[Tuple]) -> Optional[str]:
+        addresses = tuple(dict.fromkeys(i[4][0] for i in info))
+        ttl = self.ttl if addresses else self.negative_ttl
+        self._cache[host] = (addresses, time.monotonic() + ttl)
+        return addresses[0] if addresses else None
+
+    def resolve(self, host: str) -> Optional[str]:
+        """resolves and caches the host, returns its first address, None if failed"""
+        if self.is_ip(host) or self._is_cached(host):
+            return self._first(host)
+        try:
+            info = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            info = []
+        return self._store(host, info)
+
+    async def aresolve(self, host: str) -> Optional[str]:
+        if self.is_ip(host) or self._is_cached(host):
+            return self._first(host)
+        # concurrent lookups of the same host share one request to the resolver
+        task = self._pending.get(host)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._alookup(host))
+            self._pending[host] = task
+        await asyncio.shield(task)
+        return self._first(host)
+
+    async def _alookup(self, host: str) -> None:
+        try:
+            info = await asyncio.get_running_loop().getaddrinfo(host, None, family=socket.AF_INET,
+                                                                type=socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            info = []
+        finally:
+            self._pending.pop(host, None)
+        self._store(host, info)
+
+    def resolve_many(self, hosts: Iterable[str]) -> Dict[str, Optional[str]]:
+        return {host: self.resolve(host) for host in set(hosts)}
+
+    async def aresolve_many(self, hosts: Iterable[str]) -> Dict[str, Optional[str]]:
+        hosts = list(set(hosts))
+        return dict(zip(hosts, await asyncio.gather(*(self.aresolve(host) for host in hosts))))
+
+    def resolved_url(self, proxy: 'Proxy') -> str:
+        """
+        proxy.url with the next cached address in place of the hostname.
+        https proxies keep the hostname, TLS to the proxy needs it for certificate verification
+        """
+        if proxy.protocol == 'https':
+            return proxy.url
+        ip = self.get(proxy.ip)
+        if not ip or ip == proxy.ip:
+            return proxy.url
+        parsed = ProxyStringParser(**{**proxy.json(), 'ip': ip})
+        return get_fromated_proxy_string(parsed, 'protocol://username:password@ip:port')
+
+    def endpoint(self, proxy: 'Proxy') -> Tuple:
+        """proxies with equal endpoints reach the same servers with the same credentials"""
+        # like in resolved_url, https proxies are identified by hostname
+        addresses = () if proxy.protocol == 'https' else self.get_all(proxy.ip)
+        return proxy.protocol, proxy.username, proxy.password, addresses or (proxy.ip,), proxy.port
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._counters.clear()
+
+
+dns_cache = DNSCache()
@@ -0,0 +1,175 @@
+from typing import Any, Callable, Deque, Dict, Hashable, List, NamedTuple, Optional, Set, Tuple, Union
+from collections import deque
+from urllib.parse import urlparse
+import asyncio
+import time
+
+from .extended_proxy import Proxy, acheck_proxy, acheck_proxies, DEFAULT_CHECK_FIELDS
+from .resolver import DNSCache, dns_cache as default_dns_cache
+
+
+class GroupLimits(NamedTuple):
+    concurrency: int = 10
+    rate: Optional[float] = None  # checks started per second, None for unlimited
+
+
+class ProxyStats(NamedTuple):
+    ok: bool
+    latency: float
+    checked_at: float
+
+
+class CheckScheduler:
+    """
+    Checks proxies grouped by provider: rotation_url domain for mobile proxies, gateway host otherwise.
+    Each group has its own concurrency and rate limits, `concurrency` caps the total.
+    Limits belong to the scheduler, so they hold across repeated and concurrent calls of one instance.
+    Free slots go to proxies in priority order over all groups, by default last known good first,
+    then by lowest latency. Results of previous checks are kept in `stats`.
+    Like acheck_proxies(), results keep the order of the input list.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 100,
+        group_limits: GroupLimits = GroupLimits(),
+        limits: Optional[Dict[str, GroupLimits]] = None,
+        priority: Optional[Callable[[Proxy], Any]] = None,
+        dns_cache: Optional[DNSCache] = default_dns_cache
+    ):
+        for group_limit in (group_limits, *(limits or {}).values()):
+            if group_limit.concurrency < 1:
+                raise ValueError(f'Group concurrency must be at least 1, got {group_limit.concurrency}')
+            if group_limit.rate is not None and group_limit.rate <= 0:
+                raise ValueError(f'Group rate must be positive or None for unlimited, got {group_limit.rate}')
+        if concurrency < 1:
+            raise ValueError(f'Concurrency must be at least 1, got {concurrency}')
+
+        self.concurrency = concurrency
+        self.group_limits = group_limits
+        self.limits = limits or {}
+        self.priority = priority or self.default_priority
+        self.dns_cache = dns_cache
+        self.stats: Dict[Proxy, ProxyStats] = {}
+        self._running: Dict[str, int] = {}
+        self._running_total = 0
+        self._last_start: Dict[str, float] = {}
+        self._waiters: List[asyncio.Future] = []
+
+    @staticmethod
+    def group_key(proxy: Proxy) -> str:
+        if proxy.rotation_url:
+            return urlparse(proxy.rotation_url).hostname
+        return proxy.ip
+
+    def get_limits(self, group: str) -> GroupLimits:
+        return self.limits.get(group, self.group_limits)
+
+    def _next_start(self, group: str) -> Optional[float]:
+        """time the group may start the next check at, None while it has no free slot"""
+        limits = self.get_limits(group)
+        if self._running_total >= self.concurrency or self._running.get(group, 0) >= limits.concurrency:
+            return None
+        if not limits.rate:
+            return 0.0
+        return self._last_start.get(group, float('-inf')) + 1 / limits.rate
+
+    def _wake_up(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def default_priority(self, proxy: Proxy) -> Tuple[int, float]:
+        stats = self.stats.get(proxy)
+        if stats is None:
+            return 1, float('inf')
+        return (0 if stats.ok else 2), stats.latency
+
+    async def acheck_proxies(
+        self,
+        proxy_list: List[Union[Proxy, str]],
+        url: str = None,
+        with_info: bool = False,
+        fields: str = DEFAULT_CHECK_FIELDS,
+        raise_on_error: bool = False
+    ) -> Union[
+        Tuple[List[Proxy], List[Proxy]],
+        Tuple[List[Tuple[Proxy, Dict]], List[Tuple[Proxy, bool]]]
+    ]:
+        return await acheck_proxies(proxy_list, url, with_info, fields, raise_on_error, scheduler=self)
+
+    async def acheck_endpoints(
+        self,
+        endpoints: Dict[Hashable, Proxy],
+        url: str = None,
+        with_info: bool = False,
+        fields: str = DEFAULT_CHECK_FIELDS,
+        raise_on_error: bool = False
+    ) -> Dict[Hashable, Union[bool, Dict]]:
+        """checks one proxy per endpoint key, used by acheck_proxies(scheduler=...)"""
+        # position in the overall priority order, the group with the best head gets a free slot first
+        queues: Dict[str, Deque[Tuple[int, Hashable, Proxy]]] = {}
+        for i, (key, proxy) in enumerate(sorted(endpoints.items(), key=lambda e: self.priority(e[1]))):
+            queues.setdefault(self.group_key(proxy), deque()).append((i, key, proxy))
+
+        infos: Dict[Hashable, Union[bool, Dict]] = {}
+        tasks: Set[asyncio.Task] = set()
+
+        async def check(group: str, key: Hashable, proxy: Proxy):
+            start = time.monotonic()
+            try:
+                _, info = await acheck_proxy(proxy, url, with_info, fields, raise_on_error, self.dns_cache)
+            finally:
+                self._running[group] -= 1
+                self._running_total -= 1
+                self._wake_up()
+            end = time.monotonic()
+            self.stats[proxy] = ProxyStats(bool(info), end - start, end)
+            infos[key] = info
+
+        try:
+            while queues or tasks:
+                now = time.monotonic()
+                next_starts = {group: self._next_start(group) for group in queues}
+                ready = [group for group, next_start in next_starts.items() if next_start is not None and next_start <= now]
+                if ready:
+                    group = min(ready, key=lambda g: queues[g][0][0])
+                    _, key, proxy = queues[group].popleft()
+                    if not queues[group]:
+                        del queues[group]
+                    self._running[group] = self._running.get(group, 0) + 1
+                    self._running_total += 1
+                    self._last_start[group] = now
+                    tasks.add(asyncio.ensure_future(check(group, key, proxy)))
+                    continue
+
+                # nothing can start: wait for any check of this scheduler to finish or for the next rate slot
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+                rate_waits = [next_start - now for next_start in next_starts.values() if next_start is not None]
+                try:
+                    await asyncio.wait([waiter], timeout=min(rate_waits, default=None))
+                finally:
+                    self._waiters.remove(waiter)
+
+                for task in [task for task in tasks if task.done()]:
+                    tasks.remove(task)
+                    task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return infos
+
+    def check_proxies(
+        self,
+        proxy_list: List[Union[Proxy, str]],
+        url: str = None,
+        with_info: bool = False,
+        fields: str = DEFAULT_CHECK_FIELDS,
+        raise_on_error: bool = False
+    ) -> Union[
+        Tuple[List[Proxy], List[Proxy]],
+        Tuple[List[Tuple[Proxy, Dict]], List[Tuple[Proxy, bool]]]
+    ]:
+        return asyncio.run(self.acheck_proxies(proxy_list, url, with_info, fields, raise_on_error))
@@ -0,0 +1,140 @@
+import unittest
+from unittest import mock
+import asyncio
+import time
+
+from proxystr import Proxy, CheckScheduler, GroupLimits, DNSCache, check_proxies
+from proxystr import scheduler as scheduler_module
+from proxystr.scheduler import ProxyStats
+
+
+class TestCheckScheduler(unittest.TestCase):
+    def setUp(self):
+        # closed ports on localhost, all checks fail fast without network
+        self.proxies = [Proxy(f'login:password@127.0.0.1:{port}') for port in range(1, 5)]
+
+    def test_group_key(self):
+        self.assertEqual(CheckScheduler.group_key(Proxy('login:password@gw.myproxy.com:3001')), 'gw.myproxy.com')
+        p = Proxy('login:password@210.173.88.77:3001[https://rotate.my-proxy.io?api_key=123]')
+        self.assertEqual(CheckScheduler.group_key(p), 'rotate.my-proxy.io')
+
+    def test_check_proxies(self):
+        scheduler = CheckScheduler()
+        success, failed = scheduler.check_proxies(self.proxies)
+        self.assertEqual(success, [])
+        self.assertEqual(set(failed), set(self.proxies))
+        self.assertFalse(scheduler.stats[self.proxies[0]].ok)
+
+    def test_rate_limit(self):
+        scheduler = CheckScheduler(limits={'127.0.0.1': GroupLimits(concurrency=4, rate=10)})
+        start = time.monotonic()
+        scheduler.check_proxies(self.proxies)
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+
+    def test_rate_limit_with_busy_global_limit(self):
+        starts = {}
+
+        async def acheck_proxy(proxy, *args):
+            starts.setdefault(proxy.ip, []).append(time.monotonic())
+            await asyncio.sleep(0.3 if proxy.ip == '127.0.0.2' else 0)
+            return proxy, True
+
+        scheduler = CheckScheduler(
+            concurrency=2,
+            group_limits=GroupLimits(concurrency=2),
+            limits={'127.0.0.1': GroupLimits(concurrency=3, rate=5)}
+        )
+        proxies = [Proxy(f'login:password@127.0.0.{i % 2 + 1}:{i}') for i in range(1, 7)]
+        with mock.patch.object(scheduler_module, 'acheck_proxy', acheck_proxy):
+            success, _ = scheduler.check_proxies(proxies)
+        self.assertEqual(success, proxies)
+        group_starts = starts['127.0.0.1']
+        self.assertEqual(len(group_starts), 3)
+        for previous, current in zip(group_starts, group_starts[1:]):
+            self.assertGreaterEqual(current - previous, 0.19)
+
+    def test_rate_limited_group_keeps_global_slots_free(self):
+        async def acheck_proxy(proxy, *args):
+            await asyncio.sleep(0.25 if proxy.ip == '127.0.0.2' else 0)
+            return proxy, True
+
+        scheduler = CheckScheduler(
+            concurrency=4,
+            group_limits=GroupLimits(concurrency=4),
+            limits={'127.0.0.1': GroupLimits(concurrency=4, rate=1)}
+        )
+        limited = [Proxy(f'login:password@127.0.0.1:{port}') for port in range(1, 5)]
+        unlimited = [Proxy(f'login:password@127.0.0.2:{port}') for port in range(1, 33)]
+        with mock.patch.object(scheduler_module, 'acheck_proxy', acheck_proxy):
+            scheduler.check_proxies(limited + unlimited)
+        # 32 checks of 0.25s with 4 global slots take 2s, the rate limited group needs 3s
+        unlimited_end = max(scheduler.stats[p].checked_at for p in unlimited)
+        unlimited_start = min(scheduler.stats[p].checked_at - scheduler.stats[p].latency for p in unlimited)
+        self.assertLess(unlimited_end - unlimited_start, 2.5)
+
+    def test_rate_limit_between_calls(self):
+        starts = []
+
+        async def acheck_proxy(proxy, *args):
+            starts.append(time.monotonic())
+            return proxy, True
+
+        async def main():
+            await asyncio.gather(scheduler.acheck_proxies([proxies[0]]), scheduler.acheck_proxies([proxies[1]]))
+            await scheduler.acheck_proxies([proxies[2]])
+
+        scheduler = CheckScheduler(group_limits=GroupLimits(concurrency=1, rate=5))
+        proxies = self.proxies[:3]
+        with mock.patch.object(scheduler_module, 'acheck_proxy', acheck_proxy):
+            asyncio.run(main())
+            scheduler.check_proxies([self.proxies[3]])
+        self.assertEqual(len(starts), 4)
+        for previous, current in zip(starts, starts[1:]):
+            self.assertGreaterEqual(current - previous, 0.19)
+
+    def test_priority_across_groups(self):
+        order = []
+
+        async def acheck_proxy(proxy, *args):
+            order.append(proxy)
+            return proxy, True
+
+        scheduler = CheckScheduler(concurrency=1)
+        good1 = Proxy('login:password@127.0.0.1:1')
+        bad1 = Proxy('login:password@127.0.0.1:2')
+        good2 = Proxy('login:password@127.0.0.2:1')
+        scheduler.stats[good1] = ProxyStats(ok=True, latency=0.1, checked_at=0)
+        scheduler.stats[bad1] = ProxyStats(ok=False, latency=0.1, checked_at=0)
+        scheduler.stats[good2] = ProxyStats(ok=True, latency=0.2, checked_at=0)
+        with mock.patch.object(scheduler_module, 'acheck_proxy', acheck_proxy):
+            scheduler.check_proxies([bad1, good2, good1])
+        self.assertEqual(order, [good1, good2, bad1])
+
+    def test_check_proxies_with_scheduler(self):
+        cache = DNSCache()
+        scheduler = CheckScheduler(dns_cache=cache)
+        _, failed = check_proxies(['login:password@localhost:1'], scheduler=scheduler)
+        self.assertEqual(failed, [Proxy('login:password@localhost:1')])
+        self.assertEqual(cache.get('localhost'), '127.0.0.1')
+        with self.assertRaises(ValueError):
+            check_proxies(self.proxies, scheduler=scheduler, use_async=False)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            CheckScheduler(concurrency=0)
+        with self.assertRaises(ValueError):
+            CheckScheduler(group_limits=GroupLimits(concurrency=0))
+        with self.assertRaises(ValueError):
+            CheckScheduler(limits={'127.0.0.1': GroupLimits(rate=0)})
+
+    def test_priority(self):
+        scheduler = CheckScheduler(group_limits=GroupLimits(concurrency=1))
+        scheduler.stats[self.proxies[3]] = ProxyStats(ok=True, latency=0.1, checked_at=0)
+        _, failed = scheduler.check_proxies(self.proxies)
+        self.assertEqual(failed, self.proxies)
+        first = min(self.proxies, key=lambda p: scheduler.stats[p].checked_at)
+        self.assertEqual(first, self.proxies[3])
+
+
+if __name__ == '__main__':
+    unittest.main()